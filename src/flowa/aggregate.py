@@ -5,14 +5,17 @@ import json
 import logging
 import re
 import time
-from collections.abc import AsyncIterable
-from typing import Any
+from collections.abc import AsyncIterable, Collection
+from typing import Any, Literal, get_args
 
 import logfire
+import pydantic
 import typer
 from botocore.exceptions import ClientError
+from pydantic import BaseModel
 from pydantic_ai import Agent, ModelRetry, NativeOutput, RunContext
 from pydantic_ai.agent import AgentRunResult
+from pydantic_core import to_json
 from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
 from flowa.artifact import CategoryResult
@@ -31,10 +34,12 @@ from flowa.settings import LLM_CONCURRENCY, ModelConfig, Settings
 from flowa.storage import (
     assessment_url,
     encode_doi,
-    exists,
+    list_names,
     paper_url,
     read_json,
-    write_json,
+    read_json_many,
+    read_text,
+    write_json_many,
 )
 
 log = logging.getLogger(__name__)
@@ -45,6 +50,8 @@ _AGGREGATE_MAX_TOKENS = 64_000
 
 # Paper ID generation ({LastName}{Year} format), ported from palit.
 
+_NON_ALPHA_RE = re.compile(r'[^A-Za-z]')
+
 
 def _extract_first_author_last_name(authors: str) -> str:
     """Extract first author's last name from authors string.
@@ -62,7 +69,7 @@ def _extract_first_author_last_name(authors: str) -> str:
         return 'Unknown'
     parts = last_name.split()
     # Join multi-word last names, capitalize each part, remove non-alpha
-    return ''.join(re.sub(r'[^A-Za-z]', '', p).capitalize() for p in parts)
+    return ''.join(_NON_ALPHA_RE.sub('', p).capitalize() for p in parts)
 
 
 def generate_paper_ids(
@@ -122,6 +129,41 @@ async def _drain_events(ctx: RunContext[None], stream: AsyncIterable[Any]) -> No
         pass
 
 
+def _constrain_paper_ids(output_type: type[CategoryResult], paper_ids: Collection[str]) -> type[CategoryResult]:
+    """Narrow every ``paper_id`` in ``output_type`` to an enum of this variant's ids.
+
+    ``NativeOutput`` drives constrained sampling from the output JSON schema, so
+    with the valid ids enumerated there the model cannot emit an unknown
+    ``paper_id`` at all, instead of emitting one, failing ``paper_id_unknown`` and
+    paying for a full extended-thinking retry. The subclasses keep the set's own
+    field descriptions and extra fields. With no papers (ClinVar-only) the type is
+    returned unchanged, since an empty enum would admit nothing.
+    """
+    if not paper_ids:
+        return output_type
+    paper_id_type: Any = Literal.__getitem__(tuple(sorted(paper_ids)))
+
+    def narrowed_list(field_name: str) -> Any:
+        field = output_type.model_fields[field_name]
+        (item_type,) = get_args(field.annotation)
+        narrowed_item: type[BaseModel] = pydantic.create_model(
+            item_type.__name__,
+            __base__=item_type,
+            __doc__=item_type.__doc__,
+            paper_id=(paper_id_type, item_type.model_fields['paper_id']),
+        )
+        return (list[narrowed_item], field)  # type: ignore[valid-type]
+
+    return pydantic.create_model(
+        output_type.__name__,
+        __base__=output_type,
+        __doc__=output_type.__doc__,
+        __module__=output_type.__module__,
+        papers=narrowed_list('papers'),
+        claims=narrowed_list('claims'),
+    )
+
+
 def create_aggregate_agent(
     model: ModelConfig,
     paper_id_to_doi: dict[str, str],
@@ -138,12 +180,14 @@ def create_aggregate_agent(
     that one result; the paper-id / quote inputs are whole-variant and shared
     across categories. A violation raises ModelRetry; callers must drive this
     agent with `run` (+ `_drain_events`), not `run_stream`, for that retry to fire.
+    Paper-id membership is additionally enforced up front by the output schema
+    (see `_constrain_paper_ids`), so it should only ever fire as a backstop.
     """
     valid_paper_ids = set(paper_id_to_doi)
 
     agent: Agent[None, CategoryResult] = Agent(
         create_model(model),
-        output_type=NativeOutput(output_type),
+        output_type=NativeOutput(_constrain_paper_ids(output_type, valid_paper_ids)),
         retries=3,
         model_settings=get_model_settings(model, effort='medium', max_tokens=_AGGREGATE_MAX_TOKENS),
     )
@@ -205,15 +249,16 @@ def resolve_aggregate_citations(
     markdown — `merged.md` else `main.md` (markdown anchors) — via the same path the
     gateway uses; the convert step earlier in this pipeline wrote both, so they're present.
     """
-    # Collect all (doi, quote) pairs, grouped by DOI.
-    doi_quotes: dict[str, list[str]] = {}
+    # Collect the distinct quotes per DOI, in first-seen order. The same quote is
+    # routinely cited by several claims and categories; aligning it once is enough.
+    doi_quotes: dict[str, dict[str, None]] = {}
     for cat_result in aggregate_dict['results']:
         for claim in cat_result['claims']:
-            doi = paper_id_to_doi[claim['paper_id']]
+            quotes = doi_quotes.setdefault(paper_id_to_doi[claim['paper_id']], {})
             for citation in claim['citations']:
-                doi_quotes.setdefault(doi, []).append(citation['quote'])
+                quotes[citation['quote']] = None
 
-    citations_input = [CitationQuery(doi=doi, quotes=quotes) for doi, quotes in doi_quotes.items()]
+    citations_input = [CitationQuery(doi=doi, quotes=list(quotes)) for doi, quotes in doi_quotes.items()]
     result = resolve_citations(
         citations_input,
         pdf_index_provider=lambda doi: load_pdf_index_from_storage(base, doi),
@@ -228,9 +273,10 @@ def resolve_aggregate_citations(
     for cat_result in aggregate_dict['results']:
         for claim in cat_result['claims']:
             doi = paper_id_to_doi[claim['paper_id']]
+            resolved_quotes = result.resolved.get(doi, {})
             for citation in claim['citations']:
                 quote = citation['quote']
-                rq = result.resolved.get(doi, {}).get(quote)
+                rq = resolved_quotes.get(quote)
                 citation['location'] = rq.model_dump() if rq else None
                 if not (rq and (rq.bboxes or rq.markdown_anchor)):
                     log.warning('Quote unresolved (no bbox or anchor) for %s: %.80s...', doi, quote)
@@ -261,7 +307,7 @@ async def aggregate_evidence_async(
     aggregation_raw_url = assessment_url(base, variant_id, 'aggregation_raw.json')
 
     # Load variant details and query data (stored by query command)
-    variant_details = json.dumps(read_json(assessment_url(base, variant_id, 'variant_details.json')))
+    variant_details = read_text(assessment_url(base, variant_id, 'variant_details.json'))
     query_data = read_json(assessment_url(base, variant_id, 'query.json'))
     dois = query_data['dois']
 
@@ -282,20 +328,29 @@ async def aggregate_evidence_async(
     evidence_extractions: list[dict[str, Any]] = []
     metadata_cache: dict[str, dict[str, Any]] = {}
 
+    # One listing of the extractions directory instead of an exists() probe per DOI,
+    # then one batched read for the extractions and another for the metadata of the
+    # papers that discuss the variant.
+    extracted = list_names(assessment_url(base, variant_id, 'extractions'))
+    extracted_dois: list[str] = []
     for doi in dois:
-        extraction_url = assessment_url(base, variant_id, 'extractions', f'{encode_doi(doi)}.json')
-
-        if not exists(extraction_url):
+        if f'{encode_doi(doi)}.json' in extracted:
+            extracted_dois.append(doi)
+        else:
             log.info('Skipping %s: no extraction', doi)
-            continue
-
-        extraction_data = read_json(extraction_url)
-
-        if not extraction_data.get('variant_discussed'):
+    extraction_urls = [
+        assessment_url(base, variant_id, 'extractions', f'{encode_doi(doi)}.json') for doi in extracted_dois
+    ]
+
+    discussed: list[tuple[str, dict[str, Any]]] = []
+    for doi, extraction_data in zip(extracted_dois, read_json_many(extraction_urls), strict=True):
+        if extraction_data.get('variant_discussed'):
+            discussed.append((doi, extraction_data))
+        else:
             log.info('Skipping %s: variant not discussed', doi)
-            continue
+    discussed_metadata = read_json_many([paper_url(base, doi, 'metadata.json') for doi, _ in discussed])
 
-        metadata = read_json(paper_url(base, doi, 'metadata.json'))
+    for (doi, extraction_data), metadata in zip(discussed, discussed_metadata, strict=True):
         metadata_cache[doi] = metadata
 
         # Support both new-shape ('claims') and legacy ('evidence') extractions for
@@ -403,11 +458,19 @@ async def aggregate_evidence_async(
     with logfire.span('flowa.resolve_citations', paper_count=len(paper_id_to_doi)):
         resolve_aggregate_citations(aggregate_dict, paper_id_to_doi, base, metadata_cache)
 
-    write_json(aggregation_url, with_schema_version(aggregate_dict, AGGREGATION_SCHEMA_VERSION))
-
-    # Store the raw per-category LLM transcripts for debugging, keyed by category id.
-    raw_by_category = {category_id: json.loads(run.all_messages_json()) for category_id, run in category_runs}
-    write_json(aggregation_raw_url, raw_by_category)
+    # Store the artifact alongside the raw per-category LLM transcripts for debugging
+    # (keyed by category id), in one batched write. Each transcript is already
+    # serialised JSON, so they are spliced into one compact object (as
+    # convert_raw.json is) rather than parsed and re-indented.
+    raw_by_category = b','.join(
+        to_json(category_id) + b':' + run.all_messages_json() for category_id, run in category_runs
+    )
+    write_json_many(
+        {
+            aggregation_url: with_schema_version(aggregate_dict, AGGREGATION_SCHEMA_VERSION),
+            aggregation_raw_url: b'{' + raw_by_category + b'}',
+        }
+    )
 
     total_claims = sum(len(r['claims']) for r in results)
     total_papers = sum(len(r['papers']) for r in results)
@@ -67,6 +67,8 @@ _markitdown = MarkItDown(enable_plugins=False)
 
 _OFFICE_SUFFIXES = ('.xlsx', '.xls', '.docx')
 
+_NUMBERED_MARKER_RE = re.compile(r'<!--(table|figure): \d+-->')
+
 
 def _renumber_existing_markers(markdown: str) -> str:
     """Renumber already-numbered ``<!--table: N-->`` / ``<!--figure: N-->`` document-wide.
@@ -83,7 +85,7 @@ def _renumber_existing_markers(markdown: str) -> str:
         counters[kind] += 1
         return f'<!--{kind}: {counters[kind]}-->'
 
-    return re.sub(r'<!--(table|figure): \d+-->', _renumber, markdown)
+    return _NUMBERED_MARKER_RE.sub(_renumber, markdown)
 
 
 def _convert_supplement(filename: str, data: bytes) -> str:
@@ -128,6 +130,8 @@ def assemble_paper(base: str, doi: str) -> None:
     office_parts: list[str] = []
     included = 0
     total_tokens = 0.0
+    # Read one at a time rather than batched: the token budget can stop the loop
+    # early, and a batch would fetch every (possibly large) spreadsheet regardless.
     for i, filename in enumerate(office_names):
         data = read_bytes(paper_url(base, doi, f'supplements/{filename}'))
         try:
@@ -55,8 +55,8 @@ _ZYGOSITY_TYPES: dict[str, str] = {
 }
 
 
-def _api_params(ncbi_api_key: str | None) -> dict[str, str]:
-    """Return common params, adding api_key when available."""
+def ncbi_api_params(ncbi_api_key: str | None) -> dict[str, str]:
+    """Return common E-utilities params, adding api_key when available."""
     return {'api_key': ncbi_api_key} if ncbi_api_key else {}
 
 
@@ -83,7 +83,7 @@ def query_clinvar(hgvs_c: str, ncbi_api_key: str | None = None) -> dict[str, Any
                 'db': 'clinvar',
                 'term': search_term,
                 'retmode': 'json',
-                **_api_params(ncbi_api_key),
+                **ncbi_api_params(ncbi_api_key),
             },
         )
         response.raise_for_status()
@@ -114,7 +114,7 @@ def query_clinvar(hgvs_c: str, ncbi_api_key: str | None = None) -> dict[str, Any
                 'rettype': 'vcv',
                 'retmode': 'xml',
                 'is_variationid': '',
-                **_api_params(ncbi_api_key),
+                **ncbi_api_params(ncbi_api_key),
             },
         )
         response.raise_for_status()
@@ -23,6 +23,7 @@ session has no extraction input to compare against.
 """
 
 import re
+from collections import Counter
 
 from flowa.artifact import CategoryResult
 
@@ -32,18 +33,25 @@ from flowa.artifact import CategoryResult
 _CITE_LINK_RE = re.compile(r'\[[^\]]*\]\(#cite:([^ )"]+)(?:\s+"([^"]*)")?\)')
 
 
-def _quote_grounded(quote: str, allowed: set[str]) -> bool:
+# Joins a paper's surfaced quotes into one searchable string. NUL never occurs in
+# transcribed text, so a match can't straddle two quotes.
+_QUOTE_SEP = '\x00'
+
+
+def _quote_grounded(quote: str, allowed: set[str], surfaced: str) -> bool:
     """True if `quote` is byte-present in any extraction quote the model was fed.
 
     Exact set-membership (fast path), or a contiguous substring of a surfaced
     quote — the aggregator trimming a long extraction passage to its load-bearing
-    clause is grounded, not fabricated. An empty quote grounds nothing.
+    clause is grounded, not fabricated. `surfaced` is `allowed` joined on
+    `_QUOTE_SEP`, so the substring case is one search rather than one per quote.
+    An empty quote grounds nothing.
     """
     if not quote:
         return False
     if quote in allowed:
         return True
-    return any(quote in surfaced for surfaced in allowed)
+    return _QUOTE_SEP not in quote and quote in surfaced
 
 
 def validate_aggregate_category(
@@ -66,7 +74,7 @@ def validate_aggregate_category(
     paper_id_set = set(paper_ids)
 
     if len(paper_ids) != len(paper_id_set):
-        duplicates = sorted({pid for pid in paper_ids if paper_ids.count(pid) > 1})
+        duplicates = sorted(pid for pid, n in Counter(paper_ids).items() if n > 1)
         errors.append(('paper_id_duplicate', f'papers[] has duplicate paper_id(s): {", ".join(duplicates)}'))
 
     for pid in paper_ids:
@@ -116,10 +124,13 @@ def validate_aggregate_category(
     # row) and the aggregator legitimately trims to the load-bearing clause, which
     # is still verbatim source text and still resolves to a highlight downstream.
     # Only a quote contained in NO surfaced quote is a fabrication/alteration.
+    surfaced_by_paper: dict[str, str] = {}
     for claim in cat_result.claims:
         allowed = extraction_quotes_by_paper.get(claim.paper_id, set())
+        if claim.paper_id not in surfaced_by_paper:
+            surfaced_by_paper[claim.paper_id] = _QUOTE_SEP.join(allowed)
         for citation in claim.citations:
-            if not _quote_grounded(citation.quote, allowed):
+            if not _quote_grounded(citation.quote, allowed, surfaced_by_paper[claim.paper_id]):
                 errors.append(
                     (
                         'claim_quote_not_in_extraction',
@@ -134,9 +145,19 @@ def validate_aggregate_category(
         bucket = claim_quotes_by_paper.setdefault(claim.paper_id, set())
         bucket.update(citation.quote for citation in claim.citations)
 
+    # Reverse direction, collected in the same pass over the write-up: every
+    # quote an inline link uses, per paper (see claim_not_linked_in_writeup).
+    linked_quotes_by_paper: dict[str, set[str]] = {}
+
     for field_name, text in (('notes', cat_result.notes), ('description', cat_result.description)):
-        for match in _CITE_LINK_RE.finditer(text or ''):
+        # Cheap substring probe first: a link-free field (often the description)
+        # skips the regex scan over every '[' entirely.
+        if not text or '#cite:' not in text:
+            continue
+        for match in _CITE_LINK_RE.finditer(text):
             pid, quote = match.group(1), match.group(2)
+            if quote is not None:
+                linked_quotes_by_paper.setdefault(pid, set()).add(quote)
             if pid not in paper_id_set:
                 errors.append(('cite_unknown_paper_id', f'{field_name}: #cite:{pid} references an unknown paper_id'))
                 continue
@@ -163,13 +184,6 @@ def validate_aggregate_category(
     # one of its citation quotes is used verbatim by an inline link for the same
     # paper. (Quotes that match no claim are already flagged cite_quote_mismatch
     # above; they simply never satisfy a claim here.)
-    linked_quotes_by_paper: dict[str, set[str]] = {}
-    for text in (cat_result.notes, cat_result.description):
-        for match in _CITE_LINK_RE.finditer(text or ''):
-            pid, quote = match.group(1), match.group(2)
-            if quote is not None:
-                linked_quotes_by_paper.setdefault(pid, set()).add(quote)
-
     for claim in cat_result.claims:
         linked = linked_quotes_by_paper.get(claim.paper_id, set())
         if not any(citation.quote in linked for citation in claim.citations):
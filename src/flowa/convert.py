@@ -3,7 +3,6 @@
 import asyncio
 import collections
 import io
-import json
 import logging
 import re
 import time
@@ -16,6 +15,7 @@ import typer
 from anchorite.document import chunks  # type: ignore[import-untyped]
 from pydantic_ai import Agent
 from pydantic_ai.messages import BinaryContent
+from pydantic_core import from_json, to_json
 from pypdf import PdfReader, PdfWriter
 
 from flowa.assemble import assemble_paper
@@ -33,6 +33,7 @@ from flowa.storage import (
     list_pdf_supplements,
     paper_url,
     read_bytes,
+    read_bytes_many,
     read_text,
     remove,
     write_bytes,
@@ -51,10 +52,14 @@ PDF_SUPPLEMENT_TOTAL_MAX_PAGES = 50
 
 
 def _concatenate_pdfs(pdfs: Sequence[bytes]) -> bytes:
-    """Concatenate PDFs (in order) into a single PDF's bytes."""
+    """Concatenate PDFs (in order) into a single PDF's bytes.
+
+    Outlines are not carried over: nothing downstream reads merged.pdf's bookmarks,
+    and rebuilding the outline tree is the slow part of a merge on some PDFs.
+    """
     writer = PdfWriter()
     for data in pdfs:
-        writer.append(io.BytesIO(data))
+        writer.append(io.BytesIO(data), import_outline=False)
     out = io.BytesIO()
     writer.write(out)
     return out.getvalue()
@@ -102,6 +107,9 @@ def _accept_pdf_supplements(
 # https://privacy.claude.com/en/articles/10023638-why-am-i-receiving-an-output-blocked-by-content-filtering-policy-error
 _LINE_NUM_RE = re.compile(r'^\d+\|', re.MULTILINE)
 
+# Unnumbered table/figure markers as the transcription prompt asks the model to emit them.
+_MARKER_RE = re.compile(r'<!--(table|figure)-->')
+
 _agent: Agent[None, str] = Agent(output_type=str)
 
 # Cap transcription output well above what a 10-page Markdown chunk produces
@@ -122,7 +130,7 @@ def _renumber_markers(markdown_chunks: Sequence[str]) -> list[str]:
         counters[kind] += 1
         return f'<!--{kind}: {counters[kind]}-->'
 
-    return [re.sub(r'<!--(table|figure)-->', _renumber, chunk) for chunk in markdown_chunks]
+    return [_MARKER_RE.sub(_renumber, chunk) for chunk in markdown_chunks]
 
 
 @dataclass(frozen=True)
@@ -146,7 +154,9 @@ async def _generate_markdown(chunk_bytes: bytes, model: ModelConfig, prompt: str
     markdown = _LINE_NUM_RE.sub('', output)
     # NFKC-normalize so superscript digits, ligatures, etc. match the
     # normalized character text extracted from PDFs by pypdfium2.
-    all_messages: list[dict[str, Any]] = json.loads(raw_messages_json)
+    # Traces embed the chunk's PDF as base64, so they run to megabytes; pydantic-core's
+    # parser (and `to_json` for convert_raw.json) keeps that off the stdlib json path.
+    all_messages: list[dict[str, Any]] = from_json(raw_messages_json)
     return _ChunkResult(
         markdown=unicodedata.normalize('NFKC', markdown),
         all_messages=all_messages,
@@ -214,7 +224,8 @@ async def convert_paper_async(base: str, doi: str, model: ModelConfig, prompt_se
     merged_md_url = paper_url(base, doi, 'merged.md')
     index_url = paper_url(base, doi, 'pdf_index.pkl.zst')
 
-    has_pdf = bool(list_pdf_supplements(base, doi))
+    pdf_names = list_pdf_supplements(base, doi)
+    has_pdf = bool(pdf_names)
     has_office = bool(list_office_supplements(base, doi))
 
     # Fast path: main.md + index present and the assembled Markdown is in its final
@@ -225,16 +236,17 @@ async def convert_paper_async(base: str, doi: str, model: ModelConfig, prompt_se
         log.info('Already converted: %s', doi)
         return
 
+    # Multi-MB PDF and index transfers run off the event loop, so one paper's storage
+    # round trip doesn't stall the other papers' LLM streams sharing the loop.
     try:
-        main_pdf_bytes = read_bytes(main_pdf_url)
+        main_pdf_bytes = await asyncio.to_thread(read_bytes, main_pdf_url)
     except FileNotFoundError:
         log.info('Skipping DOI %s: main.pdf not available', doi)
         return
 
-    raw_traces: list[list[list[dict[str, Any]]]] = []
     prompt: str | None = None
 
-    async def _transcribe_to(url: str, pdf_bytes: bytes, label: str) -> None:
+    async def _transcribe_to(url: str, pdf_bytes: bytes, label: str) -> list[list[dict[str, Any]]]:
         nonlocal prompt
         if prompt is None:
             prompt = load_text_prompt('transcription', prompt_set)
@@ -242,29 +254,40 @@ async def convert_paper_async(base: str, doi: str, model: ModelConfig, prompt_se
         t0 = time.monotonic()
         result = await transcribe(pdf_bytes, model=model, prompt=prompt, page_count=PAGES_PER_CHUNK)
         write_text(url, result.markdown)
-        raw_traces.append(result.all_messages)
         log.info(
             'Transcribed %s for DOI %s: %d chars in %.1fs', label, doi, len(result.markdown), time.monotonic() - t0
         )
+        return result.all_messages
 
-    # 1) main.pdf -> main.md (cached).
-    main_md_built = False
-    if not exists(main_md_url):
-        await _transcribe_to(main_md_url, main_pdf_bytes, 'main.pdf')
-        main_md_built = True
-
-    # 2) PDF supplements: page-cap, then transcribe each accepted one (cached per sidecar).
+    # 1) main.pdf -> main.md and 2) each accepted PDF supplement -> its sidecar, both
+    # cached per piece. Supplements are page-capped first. The pieces are independent
+    # LLM calls, so every missing one is transcribed concurrently rather than in turn.
+    # The supplements are read before any transcription starts, so a failed read
+    # leaves nothing half-scheduled.
     accepted: list[tuple[str, bytes]] = []
-    sidecar_built = False
-    pdf_names = list_pdf_supplements(base, doi)
     if pdf_names:
-        supps = [(name, read_bytes(paper_url(base, doi, f'supplements/{name}'))) for name in pdf_names]
+        supp_urls = [paper_url(base, doi, f'supplements/{name}') for name in pdf_names]
+        supps = list(zip(pdf_names, await asyncio.to_thread(read_bytes_many, supp_urls), strict=True))
         accepted = _accept_pdf_supplements(supps)
-        for name, data in accepted:
-            sidecar_url = paper_url(base, doi, f'supplements/{name}.md')
-            if not exists(sidecar_url):
-                await _transcribe_to(sidecar_url, data, f'supplement {name}')
-                sidecar_built = True
+
+    jobs: list[tuple[str, bytes, str]] = []
+    main_md_built = not exists(main_md_url)
+    if main_md_built:
+        jobs.append((main_md_url, main_pdf_bytes, 'main.pdf'))
+    for name, data in accepted:
+        sidecar_url = paper_url(base, doi, f'supplements/{name}.md')
+        if not exists(sidecar_url):
+            jobs.append((sidecar_url, data, f'supplement {name}'))
+    sidecar_built = len(jobs) > int(main_md_built)
+
+    # A TaskGroup cancels the sibling transcriptions as soon as one fails; the
+    # first error is re-raised bare so the paper's failure reports it, not the group.
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_transcribe_to(url, data, label)) for url, data, label in jobs]
+    except ExceptionGroup as eg:
+        raise eg.exceptions[0] from None
+    raw_traces: list[list[list[dict[str, Any]]]] = [task.result() for task in tasks]
 
     # 3) merged.pdf — the single full PDF the viewer renders and the index is built
     # from. Materialised only when accepted PDF supplements exist; otherwise full_pdf
@@ -272,7 +295,10 @@ async def convert_paper_async(base: str, doi: str, model: ModelConfig, prompt_se
     merged_pdf_changed = False
     if accepted:
         if main_md_built or sidecar_built or not exists(merged_pdf_url):
-            write_bytes(merged_pdf_url, _concatenate_pdfs([main_pdf_bytes, *(data for _, data in accepted)]))
+            merged_pdf_bytes = await asyncio.to_thread(
+                _concatenate_pdfs, [main_pdf_bytes, *(data for _, data in accepted)]
+            )
+            await asyncio.to_thread(write_bytes, merged_pdf_url, merged_pdf_bytes)
             merged_pdf_changed = True
             log.info('Built merged.pdf for %s (%d PDF supplement(s))', doi, len(accepted))
     elif exists(merged_pdf_url):
@@ -296,7 +322,7 @@ async def convert_paper_async(base: str, doi: str, model: ModelConfig, prompt_se
     # main.md) is passed as the forward-compat denoise reference. Rebuild when the full
     # PDF changed.
     if not exists(index_url) or merged_pdf_changed:
-        full_pdf_bytes = read_bytes(full_pdf_url(base, doi))
+        full_pdf_bytes = await asyncio.to_thread(read_bytes, full_pdf_url(base, doi))
         markdown = read_text(full_md_url(base, doi))
         t0 = time.monotonic()
         # PdfIndex construction drives PDFium, so it goes on the single PDFium
@@ -304,12 +330,12 @@ async def convert_paper_async(base: str, doi: str, model: ModelConfig, prompt_se
         # general pool and doesn't hold the scarce lane while other papers wait.
         payload = await run_pdfium(lambda: build_pdf_index_payload(full_pdf_bytes, markdown))
         blob = await asyncio.to_thread(lambda: serialize_pdf_index_payload(payload))
-        write_bytes(index_url, blob)
+        await asyncio.to_thread(write_bytes, index_url, blob)
         log.info('Wrote pdf_index for DOI %s: %.1f MB in %.1fs', doi, len(blob) / 1e6, time.monotonic() - t0)
 
     # 6) convert_raw.json — debug traces of whatever was transcribed this run.
     if raw_traces:
-        write_bytes(paper_url(base, doi, 'convert_raw.json'), json.dumps(raw_traces).encode())
+        write_bytes(paper_url(base, doi, 'convert_raw.json'), to_json(raw_traces))
 
 
 def convert_paper(
@@ -1,9 +1,14 @@
 """Download PDF from PMC for a single paper."""
 
 import asyncio
+import contextlib
+import functools
 import json
 import logging
 import re
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
 
 import boto3
 import httpx
@@ -15,16 +20,73 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_ex
 
 from flowa.http_retry import retry_transient_http
 from flowa.settings import Settings
-from flowa.storage import exists, paper_url, read_json, write_bytes
+from flowa.storage import exists, paper_url, read_json, read_json_many, write_many
 
 log = logging.getLogger(__name__)
 
 PMC_OA_BUCKET = 'pmc-oa-opendata'
-_S3_CONFIG = Config(signature_version=UNSIGNED, region_name='us-east-1')
-
-
-def _make_s3_client():  # type: ignore[no-untyped-def]
-    """Create an anonymous S3 client for the PMC OA bucket."""
+# The client is shared by every concurrent download (and each paper's supplement
+# fan-out), so size the connection pool past botocore's default of 10.
+_S3_CONFIG = Config(signature_version=UNSIGNED, region_name='us-east-1', max_pool_connections=32)
+
+
+class _Memo[K, V]:
+    """A bounded memo whose entries expire: least-recently-used past `maxsize`, or older than `ttl` seconds."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __contains__(self, key: K) -> bool:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        if time.monotonic() - entry[0] > self._ttl:
+            del self._entries[key]
+            return False
+        self._entries.move_to_end(key)
+        return True
+
+    def __getitem__(self, key: K) -> V:
+        return self._entries[key][1]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def update(self, items: Mapping[K, V]) -> None:
+        for key, value in items.items():
+            self[key] = value
+
+
+# Process-wide memos for the two lookups that precede every PMC download. A
+# worker running many variants sees the same PMIDs over and over (papers that
+# aren't in PMC never get a main.pdf, so they're re-resolved on every variant).
+# The worker is long-lived, so the memos are bounded and expire: a negative
+# answer ("not in PMC", "not in the OA bucket") or a latest version can change
+# once an embargo lifts or a new version is released. Only successful lookups
+# are stored; a transient failure still raises and is retried next time.
+_MEMO_MAXSIZE = 4096
+_MEMO_TTL = 6 * 60 * 60.0
+_pmcid_cache: _Memo[int, str | None] = _Memo(_MEMO_MAXSIZE, _MEMO_TTL)
+_oa_version_cache: _Memo[str, int | None] = _Memo(_MEMO_MAXSIZE, _MEMO_TTL)
+
+IDCONV_URL = 'https://pmc.ncbi.nlm.nih.gov/tools/idconv/api/v1/articles/'
+# idconv accepts up to 200 comma-separated ids per request.
+_IDCONV_BATCH_SIZE = 200
+
+
+@functools.cache
+def _s3_client():  # type: ignore[no-untyped-def]
+    """Anonymous S3 client for the PMC OA bucket, shared across the process.
+
+    Building a botocore client loads and parses the service model, which costs
+    far more than the handful of requests a typical paper makes; the client is
+    thread-safe, so one instance serves every paper in the run.
+    """
     return boto3.client('s3', config=_S3_CONFIG)
 
 
@@ -98,22 +160,22 @@ def _partition_media_urls(media_urls: list[str]) -> tuple[list[str], list[str]]:
     return pdf_urls, office_urls
 
 
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^A-Za-z0-9._-]')
+
+
 def _sanitize_supplement_filename(basename: str) -> str:
     """Sanitise a supplement basename for safe use in a storage path.
 
     PMC media basenames are ASCII-safe; user uploads vary. Collapses any
     character outside ``[A-Za-z0-9._-]`` to ``_`` and caps the length at 128.
     """
-    return re.sub(r'[^A-Za-z0-9._-]', '_', basename)[:128]
+    return _UNSAFE_FILENAME_CHARS_RE.sub('_', basename)[:128]
 
 
 @retry_transient_http
 async def _fetch_pmcid(client: httpx.AsyncClient, pmid: int, email: str, tool: str) -> str | None:
     """Resolve PMID -> PMCID via NCBI idconv; None when no PMCID is registered."""
-    url = (
-        f'https://pmc.ncbi.nlm.nih.gov/tools/idconv/api/v1/articles/'
-        f'?ids={pmid}&idtype=pmid&format=json&tool={tool}&email={email}'
-    )
+    url = f'{IDCONV_URL}?ids={pmid}&idtype=pmid&format=json&tool={tool}&email={email}'
     response = await client.get(url)
     response.raise_for_status()
     records = response.json().get('records', [])
@@ -122,6 +184,72 @@ async def _fetch_pmcid(client: httpx.AsyncClient, pmid: int, email: str, tool: s
     return records[0].get('pmcid')
 
 
+async def _fetch_pmcids(client: httpx.AsyncClient, pmids: list[int], email: str, tool: str) -> dict[int, str | None]:
+    """Resolve up to `_IDCONV_BATCH_SIZE` PMIDs in one idconv request.
+
+    Only PMIDs that come back as a record are keyed; one missing from the
+    response is left for the per-paper lookup to retry. Deliberately not wrapped
+    in `retry_transient_http`: the batch is an optimisation, and backing off on it
+    would stall every paper, while the per-paper fallback retries on its own.
+    """
+    ids = ','.join(str(pmid) for pmid in pmids)
+    url = f'{IDCONV_URL}?ids={ids}&idtype=pmid&format=json&tool={tool}&email={email}'
+    response = await client.get(url)
+    response.raise_for_status()
+    return {
+        int(record['pmid']): record.get('pmcid')
+        for record in response.json().get('records', [])
+        if record.get('pmid') is not None
+    }
+
+
+async def prefetch_pmcids(
+    base: str,
+    dois: list[str],
+    email: str = 'flowa@populationgenomics.org.au',
+    tool: str = 'flowa',
+    timeout: float = 60.0,
+    client: httpx.AsyncClient | None = None,
+) -> None:
+    """Seed the PMCID memo for a batch of papers, `_IDCONV_BATCH_SIZE` ids per request.
+
+    Each `download_paper_async` would otherwise spend its own idconv round trip;
+    a variant's papers resolve in one. The papers' metadata is read in one batched
+    fetch off the event loop; PMIDs already memoised are skipped. (Papers whose
+    main.pdf already exists are not filtered out: an extra id in the batch is
+    cheaper than a storage probe per paper.) Best-effort: a failure is logged and
+    the per-paper lookup takes over.
+    """
+    try:
+        metadata = await asyncio.to_thread(read_json_many, [paper_url(base, doi, 'metadata.json') for doi in dois])
+        pmids = list(dict.fromkeys(pmid for m in metadata if (pmid := m.get('pmid')) and pmid not in _pmcid_cache))
+        if not pmids:
+            return
+        async with contextlib.nullcontext(client) if client is not None else httpx.AsyncClient(timeout=timeout) as http:
+            for start in range(0, len(pmids), _IDCONV_BATCH_SIZE):
+                _pmcid_cache.update(await _fetch_pmcids(http, pmids[start : start + _IDCONV_BATCH_SIZE], email, tool))
+    except Exception:
+        log.warning('Batched PMCID lookup failed — falling back to per-paper lookups', exc_info=True)
+
+
+async def _lookup_pmcid(client: httpx.AsyncClient, pmid: int, email: str, tool: str) -> str | None:
+    """`_fetch_pmcid`, memoised (including negative answers) in `_pmcid_cache`."""
+    if pmid in _pmcid_cache:
+        return _pmcid_cache[pmid]
+    pmcid = await _fetch_pmcid(client, pmid, email, tool)
+    _pmcid_cache[pmid] = pmcid
+    return pmcid
+
+
+async def _lookup_latest_version(s3, pmcid: str) -> int | None:  # type: ignore[no-untyped-def]
+    """`_resolve_latest_version` off the event loop, memoised in `_oa_version_cache`."""
+    if pmcid in _oa_version_cache:
+        return _oa_version_cache[pmcid]
+    version = await asyncio.to_thread(_resolve_latest_version, s3, pmcid)
+    _oa_version_cache[pmcid] = version
+    return version
+
+
 async def fetch_pmc_paper(
     pmid: int, client: httpx.AsyncClient, email: str, tool: str
 ) -> tuple[bytes | None, list[tuple[str, bytes]], str]:
@@ -139,14 +267,14 @@ async def fetch_pmc_paper(
         ``(main_pdf_bytes_or_None, supplements, message)``.
     """
     # Step 1: Get PMCID from idconv API
-    pmcid = await _fetch_pmcid(client, pmid, email, tool)
+    pmcid = await _lookup_pmcid(client, pmid, email, tool)
     if pmcid is None:
         return None, [], 'No PMCID found (not in PMC)'
     log.debug('Found PMCID: %s', pmcid)
 
     # Step 2: Find latest version in S3 bucket
-    s3 = _make_s3_client()
-    version = await asyncio.to_thread(_resolve_latest_version, s3, pmcid)
+    s3 = _s3_client()
+    version = await _lookup_latest_version(s3, pmcid)
     if version is None:
         return None, [], f'{pmcid} not in PMC OA bucket'
 
@@ -197,8 +325,13 @@ async def download_paper_async(
     email: str = 'flowa@populationgenomics.org.au',
     tool: str = 'flowa',
     timeout: float = 60.0,
+    client: httpx.AsyncClient | None = None,
 ) -> None:
-    """Download the main PDF and supplements from PMC for a single paper."""
+    """Download the main PDF and supplements from PMC for a single paper.
+
+    Pass `client` to reuse one connection pool across papers (as `run_pipeline`
+    does); otherwise a client is opened for this paper alone.
+    """
     main_pdf_url = paper_url(base, doi, 'main.pdf')
 
     if exists(main_pdf_url):
@@ -214,20 +347,23 @@ async def download_paper_async(
 
     log.info('Downloading %s (PMID %s)', doi, pmid)
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        main_bytes, supplements, message = await fetch_pmc_paper(pmid, client, email, tool)
+    async with contextlib.nullcontext(client) if client is not None else httpx.AsyncClient(timeout=timeout) as http:
+        main_bytes, supplements, message = await fetch_pmc_paper(pmid, http, email, tool)
 
     if main_bytes is None:
         log.info('%s not available in PMC: %s', doi, message)
         return
 
-    write_bytes(main_pdf_url, main_bytes)
     # Store every supplement under papers/{doi}/supplements/. The ord prefix
     # freezes ingestion order; convert/assemble dispatch by extension (PDF
     # supplements are page-capped + merged in convert, office in assemble).
+    files = {main_pdf_url: main_bytes}
     for ord_i, (basename, data) in enumerate(supplements):
         safe = _sanitize_supplement_filename(basename)
-        write_bytes(paper_url(base, doi, f'supplements/{ord_i:03d}_{safe}'), data)
+        files[paper_url(base, doi, f'supplements/{ord_i:03d}_{safe}')] = data
+    # Off the event loop: these are the paper's multi-MB PDFs, and other papers'
+    # downloads and LLM calls share the loop.
+    await asyncio.to_thread(write_many, files)
     log.info('Downloaded %s: %s (%d bytes main, %d supplements)', doi, message, len(main_bytes), len(supplements))
 
 
@@ -1,7 +1,6 @@
 """Extract evidence from a single paper via LLM."""
 
 import asyncio
-import json
 import logging
 import time
 
@@ -17,10 +16,8 @@ from flowa.storage import (
     encode_doi,
     exists,
     full_md_url,
-    read_json,
     read_text,
-    write_bytes,
-    write_json,
+    write_many,
 )
 
 log = logging.getLogger(__name__)
@@ -84,8 +81,9 @@ async def extract_paper_async(
         log.info('Skipping %s: no transcription available', doi)
         return
 
-    # Load variant details (stored by query command)
-    variant_details = json.dumps(read_json(assessment_url(base, variant_id, 'variant_details.json')))
+    # Variant details (stored by query command), embedded in the prompt verbatim —
+    # no parse + re-serialise round trip.
+    variant_details = read_text(assessment_url(base, variant_id, 'variant_details.json'))
 
     full_text = truncate_paper_text(markdown, doi)
 
@@ -108,11 +106,15 @@ async def extract_paper_async(
         raw_messages_json = stream_result.all_messages_json()
     elapsed = time.monotonic() - t0
 
-    # Store structured extraction result
-    write_json(extraction_url, output.model_dump())
-
-    # Store raw LLM conversation for debugging
-    write_bytes(extraction_raw_url, raw_messages_json)
+    # Store the structured extraction result (serialised by pydantic-core straight
+    # from the model, no intermediate dict) and the raw LLM conversation for
+    # debugging, in one batched write.
+    write_many(
+        {
+            extraction_url: output.model_dump_json(indent=2).encode(),
+            extraction_raw_url: raw_messages_json,
+        }
+    )
 
     log.info(
         'Extracted %s: variant_discussed=%s, %d claims in %.1fs',
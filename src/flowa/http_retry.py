@@ -4,10 +4,17 @@
 retries it on timeouts, network errors, 429, and 5xx — but lets 4xx
 (other than 429) fail-fast, since most such errors indicate malformed input
 or unindexed identifiers and won't succeed on retry.
+
+Backoff is jittered so concurrent callers tripping the same rate limit don't
+retry in lockstep, and a server's `Retry-After` (seconds form) takes precedence
+when present.
 """
 
 import httpx
-from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+_MAX_WAIT = 30.0
+_jittered_backoff = wait_random_exponential(multiplier=1, min=1, max=_MAX_WAIT)
 
 
 def is_retryable_http(exc: BaseException) -> bool:
@@ -18,9 +25,31 @@ def is_retryable_http(exc: BaseException) -> bool:
     return False
 
 
+def _retry_after_seconds(exc: BaseException | None) -> float | None:
+    """The delay a 429/503 response asks for via `Retry-After`, if it gives one in seconds."""
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    value = exc.response.headers.get('Retry-After')
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None  # HTTP-date form: fall back to the jittered backoff
+
+
+def wait_transient_http(retry_state: RetryCallState) -> float:
+    """Honour `Retry-After` (capped at `_MAX_WAIT`), else jittered exponential backoff."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    retry_after = _retry_after_seconds(exc)
+    if retry_after is not None:
+        return min(retry_after, _MAX_WAIT)
+    return _jittered_backoff(retry_state)
+
+
 retry_transient_http = retry(
     stop=stop_after_attempt(5),
-    wait=wait_exponential(multiplier=1, min=1, max=30),
+    wait=wait_transient_http,
     retry=retry_if_exception(is_retryable_http),
     reraise=True,
 )
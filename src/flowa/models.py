@@ -4,6 +4,7 @@ Provider-specific settings types are imported inline because only one
 provider is installed at a time (via optional extras).
 """
 
+import functools
 import os
 from typing import Literal
 
@@ -25,8 +26,6 @@ def create_model(config: ModelConfig) -> Model | str:
     plain model string and lets pydantic-ai handle resolution.
     """
     if config.name.startswith('bedrock:'):
-        import boto3
-        from botocore.config import Config
         from pydantic_ai.models.bedrock import BedrockConverseModel
         from pydantic_ai.providers.bedrock import BedrockProvider
 
@@ -60,19 +59,20 @@ def create_model(config: ModelConfig) -> Model | str:
         #      first place. Throttle / 5xx still need caller-level retry
         #      handling — currently they propagate.
         #
+        #   3. max_pool_connections: botocore's default pool of 10 is below
+        #      LLM_CONCURRENCY, and convert fans a paper's page chunks out
+        #      within a single LLM slot, so the one shared client can have far
+        #      more streams in flight. Past the pool size each call opens and
+        #      then discards a fresh TLS connection. AWS_MAX_POOL_CONNECTIONS
+        #      overrides this default.
+        #
         # Everything else matches pydantic-ai's defaults: connect_timeout=60s
         # (also via AWS_CONNECT_TIMEOUT env), and region / profile / credentials
         # come from boto3's default session (AWS_REGION, AWS_PROFILE, etc.).
         read_timeout = float(os.getenv('AWS_READ_TIMEOUT', '1200'))
         connect_timeout = float(os.getenv('AWS_CONNECT_TIMEOUT', '60'))
-        bedrock_client = boto3.client(
-            'bedrock-runtime',
-            config=Config(
-                read_timeout=read_timeout,
-                connect_timeout=connect_timeout,
-                retries={'max_attempts': 1, 'mode': 'standard'},
-            ),
-        )
+        max_pool_connections = int(os.getenv('AWS_MAX_POOL_CONNECTIONS', '64'))
+        bedrock_client = _bedrock_client(read_timeout, connect_timeout, max_pool_connections)
         return BedrockConverseModel(
             config.name.removeprefix('bedrock:'),
             provider=BedrockProvider(bedrock_client=bedrock_client),
@@ -80,6 +80,28 @@ def create_model(config: ModelConfig) -> Model | str:
     return config.name
 
 
+@functools.cache
+def _bedrock_client(read_timeout: float, connect_timeout: float, max_pool_connections: int):  # type: ignore[no-untyped-def]
+    """bedrock-runtime client shared by every Bedrock model built with these settings.
+
+    ``create_model`` runs per LLM call (each paper's convert + extract, each
+    aggregate category); building a botocore client loads and parses the service
+    model each time, while one thread-safe client can serve them all.
+    """
+    import boto3
+    from botocore.config import Config
+
+    return boto3.client(
+        'bedrock-runtime',
+        config=Config(
+            read_timeout=read_timeout,
+            connect_timeout=connect_timeout,
+            max_pool_connections=max_pool_connections,
+            retries={'max_attempts': 1, 'mode': 'standard'},
+        ),
+    )
+
+
 def get_model_settings(
     config: ModelConfig,
     *,
@@ -91,6 +91,7 @@ from flowa.schema import NORMALIZED_VARIANT_SCHEMA_VERSION
 log = logging.getLogger(__name__)
 
 VEP_REST_BASE = 'https://rest.ensembl.org'
+_ENSEMBL_TIMEOUT = 30.0
 
 # GRCh38 chromosome name → RefSeq accession used in HGVS g. notation.
 # Source: NCBI GRCh38.p14 assembly definitions.
@@ -158,7 +159,7 @@ _PROMPT_RELEVANT_BIOTYPES: frozenset[str] = frozenset({'protein_coding'})
 
 
 @retry_transient_http
-async def _fetch_vep(hgvs: str) -> tuple[list[dict], str | None]:
+async def _fetch_vep(client: httpx.AsyncClient, hgvs: str) -> tuple[list[dict], str | None]:
     """Call VEP REST for a single HGVS string with RefSeq annotation enabled.
 
     Uses the standard `/vep/human/hgvs/<hgvs>` endpoint with `refseq=1`,
@@ -173,18 +174,17 @@ async def _fetch_vep(hgvs: str) -> tuple[list[dict], str | None]:
     params = {'mane': 1, 'numbers': 1, 'protein': 1, 'hgvs': 1, 'refseq': 1}
 
     log.info('Querying VEP REST for %s', hgvs)
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(
-            url,
-            params=params,
-            headers={'accept': 'application/json'},
-        )
-        response.raise_for_status()
-        return response.json(), response.headers.get('x-ensembl-release')
+    response = await client.get(
+        url,
+        params=params,
+        headers={'accept': 'application/json'},
+    )
+    response.raise_for_status()
+    return response.json(), response.headers.get('x-ensembl-release')
 
 
 @retry_transient_http
-async def _fetch_recoder(hgvs: str) -> dict:
+async def _fetch_recoder(client: httpx.AsyncClient, hgvs: str) -> dict:
     """Resolve canonical forward-strand genomic forms via Ensembl Variant Recoder.
 
     VEP's `/vep/human/hgvs` endpoint never returns `hgvsg`, and its
@@ -201,10 +201,11 @@ async def _fetch_recoder(hgvs: str) -> dict:
     log.info('Querying Variant Recoder REST for %s', hgvs)
     # Variant Recoder can take ~1 min for very large genes (e.g. TTN), well past
     # the default read timeout, so allow a generous read while keeping connect tight.
-    async with httpx.AsyncClient(timeout=httpx.Timeout(30.0, read=120.0)) as client:
-        response = await client.get(url, headers={'accept': 'application/json'})
-        response.raise_for_status()
-        data = response.json()
+    response = await client.get(
+        url, headers={'accept': 'application/json'}, timeout=httpx.Timeout(_ENSEMBL_TIMEOUT, read=120.0)
+    )
+    response.raise_for_status()
+    data = response.json()
 
     if not isinstance(data, list) or not data:
         raise ValueError(f'Variant Recoder returned no records for {hgvs!r}')
@@ -352,10 +353,19 @@ async def normalize_variant(hgvs: str, caller_transcript: str) -> dict:
             `transcript_consequences[]` (caller typo or unindexed
             transcript).
     """
-    (annotations, source_version), recoder_rec = await asyncio.gather(
-        _fetch_vep(hgvs),
-        _fetch_recoder(hgvs),
-    )
+    # Both calls hit the same Ensembl REST host; one client shares its TLS
+    # setup and connection pool between them. The TaskGroup cancels the sibling
+    # call before the client closes when one fails (e.g. a VEP 400 on bad input);
+    # its first error is re-raised bare so callers still see the HTTPStatusError.
+    async with httpx.AsyncClient(timeout=_ENSEMBL_TIMEOUT) as client:
+        try:
+            async with asyncio.TaskGroup() as tg:
+                vep_task = tg.create_task(_fetch_vep(client, hgvs))
+                recoder_task = tg.create_task(_fetch_recoder(client, hgvs))
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+    annotations, source_version = vep_task.result()
+    recoder_rec = recoder_task.result()
     if not annotations:
         raise ValueError(f'VEP returned no annotations for {hgvs!r}')
 
@@ -39,6 +39,7 @@ Schema interface requirements (accessed by Flowa's validation logic):
     - CategoryResult.claims[].paper_id and .citations[].quote
 """
 
+import functools
 import importlib.util
 import json
 import logging
@@ -68,6 +69,17 @@ _jinja_env = jinja2.Environment(
 _BUNDLED_ROOT = Path(__file__).parent
 
 
+@functools.cache
+def _compile_template(source: str) -> jinja2.Template:
+    """Compile a prompt template once per distinct source text.
+
+    Extraction loads its prompt once per paper, so re-parsing and re-generating the
+    same template dominates the load. Keying on the source (not the path) keeps the
+    cache correct across prompt-set edits and ``FLOWA_PROMPT_DIR`` changes.
+    """
+    return _jinja_env.from_string(source)
+
+
 def _prompts_dir(prompt_set: str) -> Path:
     """Resolve a prompt-set directory.
 
@@ -96,7 +108,17 @@ def _prompts_dir(prompt_set: str) -> Path:
 
 
 def _load_model_from_module(module_path: Path, class_name: str, module_key: str) -> type[BaseModel]:
-    """Import a schema module by path and return one of its model classes."""
+    """Import a schema module by path and return one of its model classes.
+
+    Memoised on the resolved path and modification time, so the per-paper loads
+    during extraction execute the module (and build its Pydantic models) once,
+    while an edited schema file is still picked up.
+    """
+    return _import_model(module_path.resolve(), module_path.stat().st_mtime_ns, class_name, module_key)
+
+
+@functools.cache
+def _import_model(module_path: Path, mtime_ns: int, class_name: str, module_key: str) -> type[BaseModel]:
     spec = importlib.util.spec_from_file_location(module_key, module_path)
     if spec is None or spec.loader is None:
         raise ImportError(f'Could not load module from {module_path}')
@@ -145,7 +167,7 @@ def load_prompt_and_schema(step: str, prompt_set: str = 'generic') -> tuple[jinj
     """
     step_dir = _prompts_dir(prompt_set) / step
 
-    template = _jinja_env.from_string((step_dir / 'prompt.txt').read_text())
+    template = _compile_template((step_dir / 'prompt.txt').read_text())
     class_name = f'{step.title()}Result'
     model = _load_model_from_module(step_dir / 'schema.py', class_name, f'{prompt_set}_{step}_schema')
     log.info('Loaded %s/%s/prompt.txt + schema.py (%s)', prompt_set, step, class_name)
@@ -179,7 +201,7 @@ def load_aggregation(prompt_set: str = 'generic') -> AggregationPromptSet:
     """
     agg_dir = _prompts_dir(prompt_set) / 'aggregation'
 
-    template = _jinja_env.from_string((agg_dir / 'prompt.txt').read_text())
+    template = _compile_template((agg_dir / 'prompt.txt').read_text())
     categories: list[dict[str, str]] = json.loads((agg_dir / 'categories.json').read_text())
     authoring = (agg_dir / 'authoring.txt').read_text()
     modules = {entry['id']: (agg_dir / entry['module']).read_text() for entry in categories}
@@ -1,6 +1,7 @@
 """Query literature sources and resolve to DOIs."""
 
 import asyncio
+import io
 import logging
 from typing import Any, Literal
 from xml.etree.ElementTree import Element
@@ -10,6 +11,7 @@ import typer
 from defusedxml import ElementTree
 from pydantic import ValidationError
 
+from flowa.clinvar import ncbi_api_params
 from flowa.http_retry import retry_transient_http
 from flowa.normalize import normalize_variant
 from flowa.schema import (
@@ -20,7 +22,7 @@ from flowa.schema import (
     with_schema_version,
 )
 from flowa.settings import Settings
-from flowa.storage import assessment_url, paper_url, read_json, write_json
+from flowa.storage import assessment_url, paper_url, read_json, write_json, write_json_many
 
 log = logging.getLogger(__name__)
 
@@ -32,6 +34,9 @@ relevance-ranked results, so the top entries are the most useful."""
 # Mastermind returns 5 articles per page.
 _MASTERMIND_PAGE_SIZE = 5
 _MASTERMIND_MAX_PAGES = MAX_ARTICLES // _MASTERMIND_PAGE_SIZE
+# Page requests in flight at once: enough to overlap round trips without
+# bursting the whole capped result set at Mastermind's rate limit.
+_MASTERMIND_CONCURRENCY = 3
 
 # LitVar search returns 10 results per page.
 _LITVAR_PAGE_SIZE = 10
@@ -51,51 +56,69 @@ async def query_mastermind(hgvs_g: str, api_token: str) -> list[int]:
     log.info('Querying Mastermind for %s', hgvs_g)
 
     base_url = 'https://mastermind.genomenon.com/api/v2/articles'
-    pmids: list[int] = []
-    page = 1
 
     async with httpx.AsyncClient(timeout=30.0) as client:
-        while True:
-            log.debug('Fetching page %d', page)
+        semaphore = asyncio.Semaphore(_MASTERMIND_CONCURRENCY)
 
-            response = await client.get(
-                base_url,
-                params={
-                    'api_token': api_token,
-                    'variant': hgvs_g,
-                    'page': page,
-                },
-            )
+        @retry_transient_http
+        async def fetch_page(page: int) -> dict[str, Any] | None:
+            """One page of results, or None on a 404 (no articles from this page on)."""
+            log.debug('Fetching page %d', page)
+            async with semaphore:
+                response = await client.get(
+                    base_url,
+                    params={
+                        'api_token': api_token,
+                        'variant': hgvs_g,
+                        'page': page,
+                    },
+                )
             if response.status_code == 404:
-                # Mastermind returns 404 for variants with no articles in its
-                # DB. Treat it as an empty result rather than an error so
-                # callers can still run the rest of the pipeline (ClinVar
-                # only). LitVar handles the same case via its empty-matches
-                # branch already.
-                log.warning('Mastermind has no articles for %s', hgvs_g)
-                break
+                return None
             response.raise_for_status()
-
-            data = response.json()
-
-            for article in data.get('articles', []):
-                if pmid := article.get('pmid'):
-                    pmids.append(int(pmid))
-
-            total_pages = data.get('pages', 0)
-            if page >= total_pages:
+            return response.json()
+
+        first_page = await fetch_page(1)
+        if first_page is None:
+            # Mastermind returns 404 for variants with no articles in its
+            # DB. Treat it as an empty result rather than an error so
+            # callers can still run the rest of the pipeline (ClinVar
+            # only). LitVar handles the same case via its empty-matches
+            # branch already.
+            log.warning('Mastermind has no articles for %s', hgvs_g)
+            return []
+
+        # The first page reports the page count, so the rest (up to the cap)
+        # are fetched concurrently, a few at a time, rather than one round trip
+        # at a time. The TaskGroup cancels the other pages before the client
+        # closes if one fails; its first error is re-raised bare for the caller.
+        total_pages = first_page.get('pages', 0)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(fetch_page(page)) for page in range(2, min(total_pages, _MASTERMIND_MAX_PAGES) + 1)
+                ]
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+        pages = [first_page]
+        for page, task in enumerate(tasks, start=2):
+            data = task.result()
+            if data is None:
+                # As on page 1: a 404 ends pagination. Keep the pages before it
+                # and drop it and any after it, as the sequential walk did.
+                log.warning('Mastermind has no articles for %s from page %d', hgvs_g, page)
                 break
+            pages.append(data)
 
-            if page >= _MASTERMIND_MAX_PAGES:
-                total_articles = data.get('article_count', total_pages * _MASTERMIND_PAGE_SIZE)
-                log.warning(
-                    'Capping Mastermind results at %d/%d articles',
-                    len(pmids),
-                    total_articles,
-                )
-                break
+    pmids = [int(pmid) for data in pages for article in data.get('articles', []) if (pmid := article.get('pmid'))]
 
-            page += 1
+    if total_pages > _MASTERMIND_MAX_PAGES:
+        total_articles = first_page.get('article_count', total_pages * _MASTERMIND_PAGE_SIZE)
+        log.warning(
+            'Capping Mastermind results at %d/%d articles',
+            len(pmids),
+            total_articles,
+        )
 
     return sorted(pmids)
 
@@ -118,13 +141,14 @@ async def _litvar_resolve_variant_id(client: httpx.AsyncClient, query: str, *, e
     if not matches:
         return None
 
+    selected = matches[0]
     if expected_gene:
+        # Only the first gene-matching entry is used, so stop scanning at it.
         gene_lower = expected_gene.lower()
-        matches = [m for m in matches if any(g.lower() == gene_lower for g in m.get('gene', []))]
-        if not matches:
+        selected = next((m for m in matches if any(g.lower() == gene_lower for g in m.get('gene', ()))), None)
+        if selected is None:
             return None
 
-    selected = matches[0]
     log.info(
         'LitVar matched %r → %s (rsid=%s, pmids=%d)',
         query,
@@ -258,10 +282,15 @@ def _extract_element_text(elem: Element | None) -> str:
 
 
 def _parse_article_metadata(article_elem: Element) -> dict[str, Any]:
-    """Parse metadata from a PubmedArticle XML element."""
+    """Parse metadata from a PubmedArticle XML element.
+
+    Paths are anchored at the article's MedlineCitation / PubmedData children rather
+    than `.//` searches, so each lookup walks one branch instead of the whole subtree
+    (reference lists included).
+    """
     # Extract article IDs (DOI, PMID) from ArticleIdList
     article_ids: dict[str, str] = {}
-    for article_id in article_elem.findall('.//PubmedData/ArticleIdList/ArticleId'):
+    for article_id in article_elem.findall('PubmedData/ArticleIdList/ArticleId'):
         id_type = article_id.get('IdType')
         if id_type and article_id.text:
             article_ids[id_type] = article_id.text.strip()
@@ -271,11 +300,11 @@ def _parse_article_metadata(article_elem: Element) -> dict[str, Any]:
     pmid = int(pmid_str) if pmid_str else None
 
     # Title (may contain inline elements like <i>, <sup>)
-    title = _extract_element_text(article_elem.find('.//MedlineCitation/Article/ArticleTitle'))
+    title = _extract_element_text(article_elem.find('MedlineCitation/Article/ArticleTitle'))
 
     # Authors — skip entries without LastName (consortiums, per commit ced10cc)
     author_parts: list[str] = []
-    for author in article_elem.findall('.//MedlineCitation/Article/AuthorList/Author'):
+    for author in article_elem.findall('MedlineCitation/Article/AuthorList/Author'):
         last_name_elem = author.find('LastName')
         if last_name_elem is None or not last_name_elem.text:
             continue
@@ -287,16 +316,16 @@ def _parse_article_metadata(article_elem: Element) -> dict[str, Any]:
     authors = '; '.join(author_parts)
 
     # Journal
-    journal_elem = article_elem.find('.//MedlineCitation/Article/Journal/Title')
+    journal_elem = article_elem.find('MedlineCitation/Article/Journal/Title')
     journal = journal_elem.text.strip() if journal_elem is not None and journal_elem.text else None
 
     # Abstract — join all AbstractText elements
-    abstract_elems = article_elem.findall('.//MedlineCitation/Article/Abstract/AbstractText')
+    abstract_elems = article_elem.findall('MedlineCitation/Article/Abstract/AbstractText')
     abstract_parts = [_extract_element_text(elem) for elem in abstract_elems]
     abstract = ' '.join(p for p in abstract_parts if p) or None
 
     # Entrez date
-    entrez_date_elem = article_elem.find('.//PubmedData/History/PubMedPubDate[@PubStatus="entrez"]')
+    entrez_date_elem = article_elem.find('PubmedData/History/PubMedPubDate[@PubStatus="entrez"]')
     entrez_date = _extract_date(entrez_date_elem)
 
     return {
@@ -333,23 +362,35 @@ def _extract_date(date_elem: Element | None) -> str | None:
 
 
 @retry_transient_http
-async def fetch_pubmed_metadata_batch(pmids: list[int]) -> dict[int, dict[str, Any]]:
-    """Fetch metadata for multiple papers from PubMed in a single EFetch request."""
+async def fetch_pubmed_metadata_batch(pmids: list[int], ncbi_api_key: str | None = None) -> dict[int, dict[str, Any]]:
+    """Fetch metadata for multiple papers from PubMed in a single EFetch request.
+
+    The ID list goes in a POST body rather than the query string: E-utilities
+    accept both, but a GET URL with a long comma-joined list can exceed server
+    URL limits, whereas POST takes the whole batch in one round trip. With an
+    `ncbi_api_key` the request counts against the keyed (10 req/s) limit rather
+    than the shared anonymous one, so concurrent runs are far less likely to 429.
+    """
     async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(
+        response = await client.post(
             EFETCH_URL,
-            params={
+            data={
                 'db': 'pubmed',
                 'id': ','.join(str(p) for p in pmids),
                 'retmode': 'xml',
+                **ncbi_api_params(ncbi_api_key),
             },
         )
         response.raise_for_status()
 
-    root = ElementTree.fromstring(response.content)
+    # Stream the set article by article, clearing each once parsed, so the
+    # (up to MAX_ARTICLES abstracts + reference lists) tree is never held whole.
     results: dict[int, dict[str, Any]] = {}
-    for article_elem in root.findall('PubmedArticle'):
-        metadata = _parse_article_metadata(article_elem)
+    for _, elem in ElementTree.iterparse(io.BytesIO(response.content), events=('end',)):
+        if elem.tag != 'PubmedArticle':
+            continue
+        metadata = _parse_article_metadata(elem)
+        elem.clear()
         pmid = metadata.get('pmid')
         if pmid is not None:
             results[pmid] = metadata
@@ -357,16 +398,18 @@ async def fetch_pubmed_metadata_batch(pmids: list[int]) -> dict[int, dict[str, A
     return results
 
 
-async def resolve_pmids_to_dois(base: str, pmids: list[int]) -> list[str]:
+async def resolve_pmids_to_dois(base: str, pmids: list[int], ncbi_api_key: str | None = None) -> list[str]:
     """Resolve PMIDs to DOIs via PubMed metadata, storing metadata for each paper.
 
-    Papers without a DOI are skipped.
+    Papers without a DOI are skipped. The metadata.json files are written as one
+    batch once every PMID is resolved.
     """
     if not pmids:
         return []
 
-    metadata_by_pmid = await fetch_pubmed_metadata_batch(pmids)
+    metadata_by_pmid = await fetch_pubmed_metadata_batch(pmids, ncbi_api_key)
     dois: list[str] = []
+    metadata_files: dict[str, dict[str, Any]] = {}
 
     for pmid in pmids:
         metadata = metadata_by_pmid.get(pmid)
@@ -380,10 +423,11 @@ async def resolve_pmids_to_dois(base: str, pmids: list[int]) -> list[str]:
             log.warning('Skipping PMID %s: no DOI available', pmid)
             continue
 
-        write_json(paper_url(base, doi, 'metadata.json'), with_schema_version(metadata, METADATA_SCHEMA_VERSION))
+        metadata_files[paper_url(base, doi, 'metadata.json')] = with_schema_version(metadata, METADATA_SCHEMA_VERSION)
         log.info('PMID %s -> DOI %s', pmid, doi)
         dois.append(doi)
 
+    write_json_many(metadata_files)
     return dois
 
 
@@ -462,6 +506,7 @@ async def query_dois_async(
     variant_spec: VariantSpec,
     source: Literal['mastermind', 'litvar'],
     mastermind_api_token: str | None = None,
+    ncbi_api_key: str | None = None,
 ) -> list[str]:
     """Query literature sources and resolve PMIDs to DOIs."""
     cache_url = assessment_url(base, variant_id, 'query.json')
@@ -486,7 +531,7 @@ async def query_dois_async(
 
     # Resolve PMIDs to DOIs and store metadata for each paper
     log.info('Resolving %d PMIDs to DOIs', len(pmids))
-    dois = await resolve_pmids_to_dois(base, pmids)
+    dois = await resolve_pmids_to_dois(base, pmids, ncbi_api_key)
 
     result = QueryResult(variant_spec=variant_spec, dois=dois)
     write_json(cache_url, result.model_dump())
@@ -513,7 +558,11 @@ def query_dois(
     variant_spec = parse_variant_spec_cli(variant_spec_raw)
     s = Settings()  # type: ignore[call-arg]
     try:
-        asyncio.run(query_dois_async(s.flowa_storage_base, variant_id, variant_spec, source, s.mastermind_api_token))
+        asyncio.run(
+            query_dois_async(
+                s.flowa_storage_base, variant_id, variant_spec, source, s.mastermind_api_token, s.ncbi_api_key
+            )
+        )
     except ValueError as e:
         log.error('%s', e)
         raise typer.Exit(1) from None
@@ -22,7 +22,7 @@ from anchorite import PdfIndex, locate_quote_span
 from pydantic import BaseModel, Field
 
 from flowa.pdf_index_cache import deserialize as deserialize_pdf_index_payload
-from flowa.storage import exists, full_md_url, paper_url, read_bytes, read_text
+from flowa.storage import paper_url, read_bytes, read_text
 
 log = logging.getLogger(__name__)
 
@@ -155,6 +155,7 @@ def resolve_citations(
     """
     resolved: dict[str, dict[str, ResolvedQuote]] = {}
     errors: dict[str, str] = {}
+    total_located = 0
     total_start = time.monotonic()
 
     for citation in citations:
@@ -170,15 +171,10 @@ def resolve_citations(
         located = sum(1 for q in citation.quotes if quotes[q].bboxes or quotes[q].markdown_anchor)
         log.info('Resolved %s: %d/%d quotes in %.1fs', citation.doi, located, len(citation.quotes), elapsed)
         resolved[citation.doi] = quotes
+        total_located += located
 
     total_elapsed = time.monotonic() - total_start
     total_quotes = sum(len(c.quotes) for c in citations)
-    total_located = sum(
-        1
-        for c in citations
-        for q in c.quotes
-        if (rq := resolved.get(c.doi, {}).get(q)) is not None and (rq.bboxes or rq.markdown_anchor)
-    )
     log.info(
         'Citation resolution complete: %d/%d quotes across %d papers in %.1fs',
         total_located,
@@ -201,10 +197,10 @@ def load_pdf_index_from_storage(base: str, doi: str) -> PdfIndex | None:
     consumers (`flowa-gateway`) implement their own loader against whichever
     storage client they already hold.
     """
-    index_url = paper_url(base, doi, 'pdf_index.pkl.zst')
-    if not exists(index_url):
+    try:
+        blob = read_bytes(paper_url(base, doi, 'pdf_index.pkl.zst'))
+    except FileNotFoundError:
         return None
-    blob = read_bytes(index_url)
     return deserialize_pdf_index_payload(blob).pdf_index
 
 
@@ -215,11 +211,16 @@ def load_markdown_from_storage(base: str, doi: str) -> str | None:
     office supplements; just main.md for a no-supplement paper). `resolve_citations`
     normalises it on demand via `anchorite.locate_quote_span`; there is no persisted
     markdown index to load.
+
+    Resolves `full_md_url`'s fallback by attempting the reads directly rather than
+    probing with `exists` first, so a present file costs one GET and no HEADs.
     """
-    md_url = full_md_url(base, doi)
-    if not exists(md_url):
-        return None
-    return read_text(md_url)
+    for filename in ('merged.md', 'main.md'):
+        try:
+            return read_text(paper_url(base, doi, filename))
+        except FileNotFoundError:
+            continue
+    return None
 
 
 # --- CLI --------------------------------------------------------------------
@@ -5,12 +5,13 @@ import logging
 from collections.abc import Callable
 from typing import Literal
 
+import httpx
 import logfire
 import typer
 
 from flowa.aggregate import aggregate_evidence_async
 from flowa.convert import convert_paper_async
-from flowa.download import download_paper_async
+from flowa.download import download_paper_async, prefetch_pmcids
 from flowa.extract import extract_paper_async
 from flowa.progress import ProgressCallback, ProgressEvent, Stage, emit, now_iso
 from flowa.query import query_dois_async
@@ -30,6 +31,7 @@ async def process_paper(
     download_semaphore: asyncio.Semaphore,
     llm_semaphore: asyncio.Semaphore,
     on_paper_done: Callable[[Stage, str], None] | None = None,
+    pmc_client: httpx.AsyncClient | None = None,
 ) -> None:
     """Download, convert, and extract a single paper.
 
@@ -39,11 +41,12 @@ async def process_paper(
 
     The convert and extract sub-stages are both LLM calls and share a single
     `llm_semaphore`, so total in-flight LLM work across all papers stays under
-    one ceiling.
+    one ceiling. `pmc_client`, when given, is the HTTP client shared by every
+    paper's PMC lookups.
     """
     with logfire.span('flowa.process_paper', doi=doi):
         async with download_semaphore:
-            await download_paper_async(base, doi)
+            await download_paper_async(base, doi, client=pmc_client)
         if on_paper_done is not None:
             on_paper_done('download', doi)
 
@@ -88,7 +91,9 @@ async def run_pipeline(
         # 1. Query literature sources
         log.info('=== Query (%s) ===', source)
         emit(on_progress, ProgressEvent(timestamp=now_iso(), stage='query', kind='stage_started', detail=source))
-        dois = await query_dois_async(base, variant_id, variant_spec, source, settings.mastermind_api_token)
+        dois = await query_dois_async(
+            base, variant_id, variant_spec, source, settings.mastermind_api_token, settings.ncbi_api_key
+        )
         log.info('Query complete: %d papers found', len(dois))
         emit(
             on_progress,
@@ -133,7 +138,7 @@ async def run_pipeline(
                 ),
             )
 
-        async def process_and_track(doi: str) -> None:
+        async def process_and_track(doi: str, pmc_client: httpx.AsyncClient) -> None:
             nonlocal completed, failed
             try:
                 await process_paper(
@@ -146,6 +151,7 @@ async def run_pipeline(
                     download_semaphore,
                     llm_semaphore,
                     on_paper_done=on_paper_done,
+                    pmc_client=pmc_client,
                 )
                 completed += 1
             except Exception as e:
@@ -166,9 +172,15 @@ async def run_pipeline(
                 )
             log.info('Progress: %d/%d done (%d failed)', completed + failed, len(dois), failed)
 
-        async with asyncio.TaskGroup() as tg:
-            for doi in dois:
-                tg.create_task(process_and_track(doi))
+        # One NCBI client for the whole batch, so idconv calls reuse warm
+        # connections instead of a fresh TCP/TLS handshake per paper. Every
+        # paper's PMCID is resolved up front in batched idconv calls, so the
+        # per-paper downloads skip that round trip.
+        async with httpx.AsyncClient(timeout=60.0) as pmc_client:
+            await prefetch_pmcids(base, dois, client=pmc_client)
+            async with asyncio.TaskGroup() as tg:
+                for doi in dois:
+                    tg.create_task(process_and_track(doi, pmc_client))
 
         log.info('Processing complete: %d succeeded, %d failed out of %d', completed, failed, len(dois))
 
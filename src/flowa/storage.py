@@ -29,15 +29,22 @@ Usage:
     write_json(assessment_url(base, 'var123', 'aggregation.json'), result)
 """
 
-import json
+import contextlib
+import functools
+from collections.abc import Mapping, Sequence
 from typing import Any
 from urllib.parse import quote
 
 import fsspec  # type: ignore[import-untyped]
+from pydantic_core import from_json, to_json
 
 
+@functools.lru_cache(maxsize=4096)
 def encode_doi(doi: str) -> str:
-    """Percent-encode a DOI for safe use in storage paths and filenames."""
+    """Percent-encode a DOI for safe use in storage paths and filenames.
+
+    Memoised: a run builds many paths per DOI (metadata, PDFs, markdown, extractions).
+    """
     return quote(doi, safe='')
 
 
@@ -70,49 +77,122 @@ def assessment_url(base: str, variant_id: str, *parts: str) -> str:
         assessment_url('s3://bucket', 'var123', 'extractions', '12345678.json')
         -> 's3://bucket/assessments/var123/extractions/12345678.json'
     """
-    return '/'.join([base.rstrip('/'), 'assessments', variant_id, *parts])
+    prefix = f'{base.rstrip("/")}/assessments/{variant_id}'
+    return f'{prefix}/{"/".join(parts)}' if parts else prefix
 
 
 def read_json(url: str) -> Any:
     """Read and parse JSON from a storage URL."""
-    with fsspec.open(url, 'r') as f:
-        return json.load(f)
+    return from_json(read_bytes(url))
+
+
+def read_json_many(urls: Sequence[str]) -> list[Any]:
+    """Read and parse several JSON objects on one filesystem, in ``urls`` order."""
+    return [from_json(blob) for blob in read_bytes_many(urls)]
 
 
 def write_json(url: str, data: Any) -> None:
-    """Write data as JSON to a storage URL."""
-    with fsspec.open(url, 'w') as f:
-        json.dump(data, f, indent=2)
+    """Write data as JSON to a storage URL.
+
+    Serialised by pydantic-core straight to UTF-8 bytes (non-ASCII is written
+    as-is rather than ``\\u``-escaped).
+    """
+    write_bytes(url, to_json(data, indent=2))
 
 
 def read_text(url: str) -> str:
-    """Read text from a storage URL."""
-    with fsspec.open(url, 'r') as f:
-        return f.read()
+    """Read text (UTF-8) from a storage URL.
+
+    One whole-object ``read_bytes`` decoded in place of a text-mode ``fsspec.open``
+    handle, keeping that handle's universal-newline translation (CRLF and lone CR
+    read as LF) so Markdown offsets are unchanged.
+    """
+    text = read_bytes(url).decode()
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
 
 def read_bytes(url: str) -> bytes:
-    """Read raw bytes from a storage URL."""
-    with fsspec.open(url, 'rb') as f:
-        return f.read()
+    """Read raw bytes from a storage URL.
+
+    A whole-object ``cat_file`` — a single GET on object stores — rather than a
+    buffered file handle that fetches the blob in readahead blocks.
+    """
+    fs, path = fsspec.core.url_to_fs(url)
+    return fs.cat_file(path)
+
+
+def _fs_and_paths(urls: Sequence[str]) -> tuple[Any, list[str]]:
+    """Resolve URLs on one filesystem to its paths, verbatim.
+
+    Unlike ``get_fs_token_paths``, never glob-expands: storage paths embed free-form
+    variant ids, and a ``[``, ``?`` or ``*`` in one is a literal character.
+    """
+    fs, _ = fsspec.core.url_to_fs(urls[0])
+    return fs, [fs._strip_protocol(url) for url in urls]
+
+
+def read_bytes_many(urls: Sequence[str]) -> list[bytes]:
+    """Read several objects on one filesystem, in ``urls`` order.
+
+    A single whole-object ``cat_ranges``, which async backends (s3fs, gcsfs) issue
+    as concurrent GETs rather than one round trip after another. Unlike ``cat``, it
+    reads the paths as given (no glob expansion) and returns them in order.
+    """
+    if not urls:
+        return []
+    fs, paths = _fs_and_paths(urls)
+    no_bounds = [None] * len(paths)
+    return fs.cat_ranges(paths, no_bounds, no_bounds, on_error='raise')
 
 
 def write_bytes(url: str, data: bytes) -> None:
-    """Write raw bytes to a storage URL."""
-    with fsspec.open(url, 'wb') as f:
-        f.write(data)
+    """Write raw bytes to a storage URL.
+
+    A whole-object ``pipe_file`` — a single PUT on object stores — rather than a
+    buffered file handle that uploads multi-MB PDFs as multipart blocks. Parent
+    directories are created as ``fsspec.open`` would for a write.
+    """
+    fs, path = fsspec.core.url_to_fs(url)
+    with contextlib.suppress(PermissionError):
+        fs.makedirs(fs._parent(path), exist_ok=True)
+    fs.pipe_file(path, data)
+
+
+def write_many(files: Mapping[str, bytes]) -> None:
+    """Write several objects (URL -> bytes) on one filesystem in a single batch.
+
+    Hands the whole mapping to fsspec's ``pipe``, which async backends (s3fs,
+    gcsfs) issue as concurrent PUTs rather than one round trip after another.
+    """
+    if not files:
+        return
+    fs, paths = _fs_and_paths(list(files))
+    with contextlib.suppress(PermissionError):
+        for parent in {fs._parent(path) for path in paths}:
+            fs.makedirs(parent, exist_ok=True)
+    fs.pipe(dict(zip(paths, files.values(), strict=True)))
+
+
+def write_json_many(files: Mapping[str, Any]) -> None:
+    """Write several JSON objects (URL -> data) on one filesystem in a single batch.
+
+    Serialised as ``write_json`` does, then handed to ``write_many``. A ``bytes``
+    value is taken as already-serialised JSON and written unchanged.
+    """
+    write_many({url: data if isinstance(data, bytes) else to_json(data, indent=2) for url, data in files.items()})
 
 
 def write_text(url: str, text: str) -> None:
-    """Write text to a storage URL."""
-    with fsspec.open(url, 'w') as f:
-        f.write(text)
+    """Write text (UTF-8) to a storage URL."""
+    write_bytes(url, text.encode())
 
 
 def remove(url: str) -> None:
     """Delete a file at a storage URL if it exists (no-op when already absent)."""
     fs, path = fsspec.core.url_to_fs(url)
-    if fs.exists(path):
+    with contextlib.suppress(FileNotFoundError):
         fs.rm(path)
 
 
@@ -147,13 +227,23 @@ def full_md_url(base: str, doi: str) -> str:
 _OFFICE_SUFFIXES = ('.xlsx', '.xls', '.docx')
 
 
+def list_names(url: str) -> set[str]:
+    """Basenames directly under a storage directory URL; empty when it doesn't exist.
+
+    One listing call — on object stores, far cheaper than an ``exists`` probe per
+    expected file when checking many (e.g. a variant's extractions).
+    """
+    fs, path = fsspec.core.url_to_fs(url)
+    try:
+        entries = fs.ls(path, detail=False)
+    except FileNotFoundError:  # absent directory: one call instead of exists + ls
+        return set()
+    return {entry.rstrip('/').rsplit('/', 1)[-1] for entry in entries}
+
+
 def _list_supplements(base: str, doi: str) -> list[str]:
     """All basenames under ``papers/{doi}/supplements/``, sorted by ``ord`` prefix."""
-    url = paper_url(base, doi, 'supplements')
-    fs, path = fsspec.core.url_to_fs(url)
-    if not fs.exists(path):
-        return []
-    return sorted(entry.rstrip('/').rsplit('/', 1)[-1] for entry in fs.ls(path, detail=False))
+    return sorted(list_names(paper_url(base, doi, 'supplements')))
 
 
 def list_office_supplements(base: str, doi: str) -> list[str]:
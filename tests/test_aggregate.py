@@ -20,11 +20,13 @@ from pathlib import Path
 
 import pytest
 from botocore.exceptions import ClientError
+from pydantic import ValidationError
 from pydantic_ai.models.test import TestModel
 
 import flowa.aggregate as aggregate
-from flowa.aggregate import _is_bedrock_throttle, aggregate_evidence_async
+from flowa.aggregate import _constrain_paper_ids, _is_bedrock_throttle, aggregate_evidence_async
 from flowa.prompts import load_aggregation
+from flowa.resolve import CitationQuery, ResolvedCitations, ResolvedQuote
 from flowa.settings import ModelConfig
 from flowa.storage import assessment_url, encode_doi, paper_url, write_json
 
@@ -94,6 +96,36 @@ def test_load_aggregation_rejects_non_subclass_schema(tmp_path, monkeypatch):
         load_aggregation('bad')
 
 
+# --- _constrain_paper_ids -------------------------------------------------------
+
+
+def test_constrain_paper_ids_enumerates_known_ids(multi_set):
+    base = load_aggregation(multi_set).category_result
+    narrowed = _constrain_paper_ids(base, {'Smith2020', 'Jones2019'})
+
+    defs = narrowed.model_json_schema()['$defs']
+    for model in ('Claim', 'RankedPaper'):
+        assert defs[model]['properties']['paper_id']['enum'] == ['Jones2019', 'Smith2020']
+
+    payload = {
+        'category': 'alpha',
+        'description': 'd',
+        'notes': 'n',
+        'verdict': 'v',
+        'papers': [{'paper_id': 'Smith2020', 'rank_rationale': 'r'}],
+        'claims': [],
+    }
+    assert isinstance(narrowed.model_validate(payload), base)
+    payload['papers'] = [{'paper_id': 'Doe2021', 'rank_rationale': 'r'}]
+    with pytest.raises(ValidationError):
+        narrowed.model_validate(payload)
+
+
+def test_constrain_paper_ids_without_papers_is_identity(multi_set):
+    base = load_aggregation(multi_set).category_result
+    assert _constrain_paper_ids(base, set()) is base
+
+
 # --- fan-out orchestration ------------------------------------------------------
 
 
@@ -191,6 +223,25 @@ async def test_fanout_raw_transcript_keyed_by_category(tmp_path, multi_set, patc
     assert set(raw) == {'alpha', 'beta'}
 
 
+async def test_fanout_reads_extractions_under_bracketed_variant_id(tmp_path, monkeypatch, multi_set, patched_agent):
+    """Variant ids are free-form; glob characters in one must not hide its extractions."""
+    base = str(tmp_path)
+    _seed_storage(base, 'c.[1A>G]', ['10.1/a'])
+    prompts: list[str] = []
+    fake_run = aggregate._run_category_agent
+
+    async def recording_run(agent, prompt, semaphore):
+        prompts.append(prompt)
+        return await fake_run(agent, prompt, semaphore)
+
+    monkeypatch.setattr(aggregate, '_run_category_agent', recording_run)
+
+    await aggregate_evidence_async(base, 'c.[1A>G]', MODEL, prompt_set='multi')
+
+    assert prompts and all('finding 0' in prompt for prompt in prompts)
+    assert (tmp_path / 'assessments' / 'c.[1A>G]' / 'aggregation.json').exists()
+
+
 async def test_fanout_no_empty_short_circuit(tmp_path, multi_set, patched_agent):
     """With no papers, every category still runs (each emits its own 'none' via
     the prompt) — there is no engine-level short-circuit."""
@@ -202,3 +253,33 @@ async def test_fanout_no_empty_short_circuit(tmp_path, multi_set, patched_agent)
     assert patched_agent == ['alpha', 'beta']
     written = json.loads((tmp_path / 'assessments' / 'VAR1' / 'aggregation.json').read_text())
     assert [r['category'] for r in written['results']] == ['alpha', 'beta']
+
+
+# --- resolve_aggregate_citations ------------------------------------------------
+
+
+def test_resolve_aggregate_citations_aligns_each_quote_once(monkeypatch):
+    """A quote cited by several claims/categories is resolved once and attached to every citation."""
+    seen: list[CitationQuery] = []
+
+    def fake_resolve(citations, **_):
+        seen.extend(citations)
+        return ResolvedCitations(
+            resolved={c.doi: {q: ResolvedQuote() for q in c.quotes} for c in citations},
+        )
+
+    monkeypatch.setattr(aggregate, 'resolve_citations', fake_resolve)
+    claim = {'paper_id': 'A2020', 'citations': [{'quote': 'q1'}, {'quote': 'q2'}]}
+    aggregate_dict = {
+        'results': [
+            {'claims': [claim, {'paper_id': 'A2020', 'citations': [{'quote': 'q1'}]}]},
+            {'claims': [{'paper_id': 'A2020', 'citations': [{'quote': 'q2'}]}]},
+        ]
+    }
+
+    aggregate.resolve_aggregate_citations(aggregate_dict, {'A2020': '10.1/a'}, 'unused', {'10.1/a': {'pmid': '1'}})
+
+    assert [(c.doi, c.quotes) for c in seen] == [('10.1/a', ['q1', 'q2'])]
+    citations = [cit for r in aggregate_dict['results'] for cl in r['claims'] for cit in cl['citations']]
+    assert all(cit['location'] == {'bboxes': [], 'markdown_anchor': None} for cit in citations)
+    assert aggregate_dict['paper_id_mapping'] == {'A2020': {'doi': '10.1/a', 'pmid': '1'}}
@@ -213,3 +213,20 @@ def test_claim_quote_substring_of_extraction_passes() -> None:
         extraction_quotes_by_paper={'Smith2024': {surfaced}},
     )
     assert errors == []
+
+
+def test_claim_quote_spanning_two_extraction_quotes_flagged() -> None:
+    # Substring grounding is per surfaced quote: text stitched across the end of
+    # one quote and the start of another is not verbatim source text.
+    stitched = 'probands. Functional'
+    cat = _cat(
+        notes=f'Stitched ([x](#cite:Smith2024 "{stitched}")).',
+        papers=('Smith2024',),
+        claims=(_claim('Smith2024', stitched),),
+    )
+    errors = validate_aggregate_category(
+        cat,
+        valid_paper_ids={'Smith2024'},
+        extraction_quotes_by_paper={'Smith2024': {_Q1, _Q2}},
+    )
+    assert _rules(errors) == {'claim_quote_not_in_extraction'}
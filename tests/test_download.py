@@ -6,10 +6,23 @@ the deterministic partitioning and filename-sanitisation logic, plus
 the network fetch monkeypatched.
 """
 
-from flowa.download import _partition_media_urls, _sanitize_supplement_filename, download_paper_async
+from typing import cast
+
+import httpx
+
+from flowa.download import (
+    _lookup_pmcid,
+    _Memo,
+    _partition_media_urls,
+    _sanitize_supplement_filename,
+    download_paper_async,
+    prefetch_pmcids,
+)
 from flowa.storage import paper_url, read_bytes, write_bytes, write_json
 
 DOI = '10.1234/dl.test'
+# The idconv fetch is monkeypatched wherever this is passed, so no client is needed.
+NO_CLIENT = cast(httpx.AsyncClient, None)
 
 
 def test_partition_media_urls_splits_by_extension() -> None:
@@ -88,3 +101,64 @@ async def test_download_skips_when_main_pdf_exists(tmp_path, monkeypatch) -> Non
 
     assert not called  # main.pdf present -> the whole PMC fetch is skipped
     assert read_bytes(paper_url(base, DOI, 'main.pdf')) == b'EXISTING'
+
+
+async def test_lookup_pmcid_memoises_per_process(monkeypatch) -> None:
+    calls: list[int] = []
+
+    async def fake_fetch_pmcid(client, pmid, email, tool):
+        calls.append(pmid)
+        return None if pmid == 2 else f'PMC{pmid}'
+
+    monkeypatch.setattr('flowa.download._fetch_pmcid', fake_fetch_pmcid)
+    monkeypatch.setattr('flowa.download._pmcid_cache', _Memo(16, 60.0))
+
+    assert await _lookup_pmcid(NO_CLIENT, 1, 'e', 't') == 'PMC1'
+    assert await _lookup_pmcid(NO_CLIENT, 1, 'e', 't') == 'PMC1'
+    # "Not in PMC" is cached too — it's the answer that recurs across variants.
+    assert await _lookup_pmcid(NO_CLIENT, 2, 'e', 't') is None
+    assert await _lookup_pmcid(NO_CLIENT, 2, 'e', 't') is None
+    assert calls == [1, 2]
+
+
+async def test_prefetch_pmcids_seeds_memo_in_one_batch(tmp_path, monkeypatch) -> None:
+    base = str(tmp_path)
+    for i, pmid in enumerate((1, 2, 3)):
+        write_json(paper_url(base, f'10.1/{i}', 'metadata.json'), {'pmid': pmid})
+    batches: list[list[int]] = []
+
+    async def fake_fetch_pmcids(client, pmids, email, tool):
+        batches.append(pmids)
+        return {1: 'PMC1', 2: None}
+
+    async def fail_fetch_pmcid(client, pmid, email, tool):
+        raise AssertionError('per-paper idconv should be served from the memo')
+
+    monkeypatch.setattr('flowa.download._fetch_pmcids', fake_fetch_pmcids)
+    monkeypatch.setattr('flowa.download._fetch_pmcid', fail_fetch_pmcid)
+    memo: _Memo[int, str | None] = _Memo(16, 60.0)
+    memo[3] = 'PMC3'  # already memoised -> skipped
+    monkeypatch.setattr('flowa.download._pmcid_cache', memo)
+
+    await prefetch_pmcids(base, ['10.1/0', '10.1/1', '10.1/2'])
+
+    assert batches == [[1, 2]]
+    assert await _lookup_pmcid(NO_CLIENT, 1, 'e', 't') == 'PMC1'
+    assert await _lookup_pmcid(NO_CLIENT, 2, 'e', 't') is None
+
+
+def test_memo_evicts_least_recently_used_and_expires(monkeypatch) -> None:
+    now = 0.0
+    monkeypatch.setattr('flowa.download.time.monotonic', lambda: now)
+    memo: _Memo[int, str | None] = _Memo(2, 60.0)
+    memo[1] = 'PMC1'
+    memo[2] = None
+    assert 1 in memo  # touch 1, so 2 is the least recently used
+    memo[3] = 'PMC3'
+    assert 2 not in memo
+    assert memo[1] == 'PMC1'
+
+    # A negative answer ("not in PMC") is re-resolved once it ages out.
+    memo[4] = None
+    now = 61.0
+    assert 4 not in memo
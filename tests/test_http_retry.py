@@ -0,0 +1,43 @@
+"""Tests for `flowa.http_retry`: which failures retry, and how long to wait between attempts."""
+
+import httpx
+import pytest
+from tenacity import RetryCallState, Retrying
+
+from flowa.http_retry import is_retryable_http, wait_transient_http
+
+
+def _status_error(status: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request('GET', 'https://example.org')
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError('x', request=request, response=response)
+
+
+def _failed_attempt(exc: BaseException, attempt: int = 1) -> RetryCallState:
+    state = RetryCallState(retry_object=Retrying(), fn=None, args=(), kwargs={})
+    state.attempt_number = attempt
+    state.set_exception((type(exc), exc, None))
+    return state
+
+
+@pytest.mark.parametrize(('status', 'expected'), [(429, True), (503, True), (404, False), (400, False)])
+def test_is_retryable_http_status(status, expected):
+    assert is_retryable_http(_status_error(status)) is expected
+
+
+def test_wait_honours_retry_after_seconds():
+    assert wait_transient_http(_failed_attempt(_status_error(429, {'Retry-After': '7'}))) == 7.0
+
+
+def test_wait_caps_retry_after():
+    assert wait_transient_http(_failed_attempt(_status_error(503, {'Retry-After': '3600'}))) == 30.0
+
+
+def test_wait_falls_back_to_jittered_backoff():
+    """No (or an HTTP-date) Retry-After: a jittered wait bounded by the exponential ceiling."""
+    waits = {
+        wait_transient_http(_failed_attempt(_status_error(429, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}), 3))
+        for _ in range(20)
+    }
+    assert all(1 <= w <= 8 for w in waits)
+    assert len(waits) > 1
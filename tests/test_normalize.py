@@ -8,6 +8,11 @@ strand-naive construction this replaced sent `g.…T>C` to Mastermind and got
 zero papers for every minus-strand variant.
 """
 
+import asyncio
+
+import httpx
+import pytest
+
 import flowa.normalize as normalize
 
 # Minimal VEP response for GJB2 NM_004004.6:c.101T>C (minus strand). Only the
@@ -45,10 +50,10 @@ _GJB2_RECODER = {
 
 
 def _patch(monkeypatch, vep, recoder):
-    async def fake_vep(hgvs):
+    async def fake_vep(client, hgvs):
         return vep, '114'
 
-    async def fake_recoder(hgvs):
+    async def fake_recoder(client, hgvs):
         return recoder
 
     monkeypatch.setattr(normalize, '_fetch_vep', fake_vep)
@@ -101,3 +106,31 @@ async def test_recoder_indel_uses_spdi_sequences(monkeypatch):
     g = result['grch38']
     assert g['hgvs_g'] == 'NC_000002.12:g.227311867_227311884del'
     assert (g['chrom'], g['pos'], g['ref'], g['alt']) == ('2', 227311867, 'CTGAAGCTAAAAAAGACA', '')
+
+
+async def test_vep_error_cancels_recoder_and_propagates_unwrapped(monkeypatch):
+    # A VEP 400 on bad input must surface as the HTTPStatusError itself, and the
+    # in-flight Recoder call must be cancelled before the shared client closes.
+    request = httpx.Request('GET', 'https://rest.ensembl.org/vep')
+    error = httpx.HTTPStatusError('400', request=request, response=httpx.Response(400, request=request))
+    recoder_cancelled = False
+
+    async def failing_vep(client, hgvs):
+        raise error
+
+    async def slow_recoder(client, hgvs):
+        nonlocal recoder_cancelled
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            recoder_cancelled = True
+            raise
+
+    monkeypatch.setattr(normalize, '_fetch_vep', failing_vep)
+    monkeypatch.setattr(normalize, '_fetch_recoder', slow_recoder)
+
+    with pytest.raises(httpx.HTTPStatusError) as excinfo:
+        await normalize.normalize_variant('NM_004004.6:c.bad', 'NM_004004.6')
+
+    assert excinfo.value is error
+    assert recoder_cancelled
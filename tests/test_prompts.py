@@ -92,6 +92,14 @@ def test_aggregation_prompt_strict_undefined():
         agg.template.render(variant_details='only this one provided')
 
 
+def test_extraction_prompt_and_schema_loaded_once():
+    """Per-paper reloads reuse the compiled template and schema class while the files are unchanged."""
+    first_template, first_model = load_prompt_and_schema('extraction', 'generic')
+    second_template, second_model = load_prompt_and_schema('extraction', 'generic')
+    assert first_template is second_template
+    assert first_model is second_model
+
+
 def test_load_text_prompt_uses_active_set_when_present(tmp_path, monkeypatch):
     """If the active set has the file, use it (no fallback)."""
     (tmp_path / 'custom').mkdir()
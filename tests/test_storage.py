@@ -0,0 +1,44 @@
+"""Tests for `flowa.storage`'s batched helpers.
+
+Run against a local storage base. Variant ids are free-form CLI input and land
+verbatim in assessment paths, so the batched helpers must treat glob characters
+in them literally.
+"""
+
+from flowa.storage import assessment_url, read_bytes, read_json, read_json_many, write_json_many, write_many
+
+VARIANT_ID = 'c.[1A>G]'
+
+
+def test_write_many_with_glob_characters_in_path(tmp_path):
+    base = str(tmp_path)
+    files = {
+        assessment_url(base, VARIANT_ID, 'extractions', 'a.json'): b'{"a": 1}',
+        assessment_url(base, VARIANT_ID, 'extractions', 'a_raw.json'): b'[]',
+    }
+
+    write_many(files)
+
+    for url, data in files.items():
+        assert read_bytes(url) == data
+
+
+def test_read_json_many_with_glob_characters_in_path(tmp_path):
+    base = str(tmp_path)
+    urls = [assessment_url(base, VARIANT_ID, 'extractions', f'{name}.json') for name in ('b', 'a')]
+    write_many({urls[0]: b'{"n": "b"}', urls[1]: b'{"n": "a"}'})
+
+    assert read_json_many(urls) == [{'n': 'b'}, {'n': 'a'}]  # urls order, not listing order
+
+
+def test_write_json_many_round_trips(tmp_path):
+    base = str(tmp_path)
+    files = {
+        assessment_url(base, VARIANT_ID, 'extractions', 'a.json'): {'n': 'a'},
+        assessment_url(base, VARIANT_ID, 'extractions', 'b.json'): {'n': 'é'},
+        assessment_url(base, VARIANT_ID, 'extractions', 'c.json'): b'{"n":"c"}',  # pre-serialised: as-is
+    }
+
+    write_json_many(files)
+
+    assert [read_json(url) for url in files] == [{'n': 'a'}, {'n': 'é'}, {'n': 'c'}]